@@ -1 +1,9 @@
-from .lava import Lava, LavaError
\ No newline at end of file
+from .lava import (
+    Lava,
+    LavaError,
+    LavaResponseError,
+    close_all,
+    get_client,
+    use_windows_selector_policy,
+)
+from .batcher import InvoiceInfoBatcher
\ No newline at end of file
@@ -0,0 +1,76 @@
+import asyncio
+from typing import Dict, List, Optional
+from .lava import Lava
+
+
+class InvoiceInfoBatcher:
+    """Объединение запросов invoice_info от многих задач
+        Номера счетов копятся в течение window_ms, затем запрашиваются параллельно
+        (не более concurrency одновременно). Одинаковые номера запрашиваются один раз.
+    """
+
+    def __init__(
+        self, client: Lava, concurrency: int = 16, window_ms: float = 10
+    ) -> None:
+        """__init__
+
+        Args:
+            client (Lava): Клиент, через который выполняются запросы
+            concurrency (int, optional): Максимальное число одновременных запросов. Defaults to 16.
+            window_ms (float, optional): Время накопления номеров в миллисекундах. Defaults to 10.
+        """
+        self._client = client
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._window = window_ms / 1000
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def get(self, id: str) -> Dict:
+        """Получение информации о выставленном счете, см. Lava.invoice_info
+
+        Args:
+            id (str): Номер счета в нашей системе
+
+        Returns:
+            Dict: Ответ invoice_info
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(id, []).append(future)
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush())
+        return await future
+
+    async def _flush(self) -> None:
+        pending: Dict[str, List[asyncio.Future]] = {}
+        try:
+            await asyncio.sleep(self._window)
+            pending, self._pending = self._pending, {}
+            self._flush_task = None
+            results = await asyncio.gather(
+                *(self._fetch(id) for id in pending), return_exceptions=True
+            )
+            for futures, result in zip(pending.values(), results):
+                for future in futures:
+                    if future.done():
+                        continue
+                    if isinstance(result, asyncio.CancelledError):
+                        future.cancel()
+                    elif isinstance(result, BaseException):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+        finally:
+            if self._flush_task is asyncio.current_task():
+                # Cancelled before the window closed, let the next get() start over
+                pending, self._pending = self._pending, {}
+                self._flush_task = None
+            # Don't leave callers waiting if this task was cancelled
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.cancel()
+
+    async def _fetch(self, id: str) -> Dict:
+        async with self._semaphore:
+            return await self._client.invoice_info(id=id)
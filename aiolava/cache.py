@@ -0,0 +1,28 @@
+from typing import Any, Dict, Hashable, Optional
+from cachetools import TTLCache
+
+
+class ResponseCache:
+    """TTL-кэш ответов на идемпотентные запросы"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 5) -> None:
+        """__init__
+
+        Args:
+            maxsize (int, optional): Максимальное число закэшированных ответов. Defaults to 1024.
+            ttl (float, optional): Время жизни ответа в секундах. Defaults to 5.
+        """
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    @staticmethod
+    def _key(path: str, data: Optional[Dict]) -> Hashable:
+        return path, frozenset(data.items()) if data else None
+
+    def get(self, path: str, data: Optional[Dict]) -> Optional[Any]:
+        return self._cache.get(self._key(path, data))
+
+    def set(self, path: str, data: Optional[Dict], result: Any) -> None:
+        self._cache[self._key(path, data)] = result
+
+    def clear(self) -> None:
+        self._cache.clear()
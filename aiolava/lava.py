@@ -1,116 +1,151 @@
 # https://github.com/1ort/aiolava
 import asyncio
 import aiohttp
-from typing import Dict, List, Optional
+import inspect
+import json
+from typing import Any, AsyncIterator, Dict, NamedTuple, Optional, Type
 import platform
-from pydantic import validate_arguments, HttpUrl
+import random
+import socket
+import pydantic_core
+from pydantic import AnyUrl, BaseModel, ValidationError
+from . import models
+from .cache import ResponseCache
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-if platform.system() == "Windows":
-    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import aiodns
+except ImportError:
+    aiodns = None
+
+
+def _json_default(obj: Any) -> str:
+    # pydantic v2 URL types (HttpUrl etc.) are not str subclasses
+    if isinstance(obj, (AnyUrl, pydantic_core.Url)):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default).decode()
+    return json.dumps(obj, default=_json_default)
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def use_windows_selector_policy() -> None:
+    """Установка WindowsSelectorEventLoopPolicy (только на Windows)
+        Может потребоваться для aiodns и некоторых SSL-конфигураций.
+        Вызывайте до запуска event loop.
+    """
+    if platform.system() == "Windows":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
 
 class LavaError(Exception):
     pass
 
 
+class LavaResponseError(Exception):
+    """Ответ на запрос не удалось разобрать
+        Запрос мог быть уже выполнен API, не повторяйте его без проверки.
+    """
+
+    def __init__(self, endpoint: str, result: Any) -> None:
+        super().__init__(f"Unexpected response from {endpoint}: {result!r}")
+        self.endpoint = endpoint
+        self.result = result
+
+
+def _raise_for_error(result: Any) -> None:
+    if _is_error(result):
+        raise LavaError(f'{result.get("code")}: {result.get("message", "")}')
+
+
+def _is_error(result: Any) -> bool:
+    return isinstance(result, dict) and result.get("status") == "error"
+
+
+async def _read_json(responce: aiohttp.ClientResponse) -> Any:
+    # Bodies of failed requests that aren't Lava error objects (e.g. an HTML
+    # page from a proxy) are reported with their HTTP status
+    try:
+        result = await responce.json(loads=_json_loads, content_type=None)
+    except ValueError:
+        responce.raise_for_status()
+        raise
+    if responce.status >= 400 and not _is_error(result):
+        responce.raise_for_status()
+    return result
+
+
 class Lava:
+    __slots__ = (
+        "api_key",
+        "_pool_size",
+        "_keepalive_timeout",
+        "_session",
+        "_cache",
+        "_retries",
+        "_retry_backoff_base",
+    )
+
     path_prefix = "https://api.lava.ru"
 
-    def __init__(self, api_key: str) -> None:
+    # Most API methods are generated from _ENDPOINTS at the bottom of this module
+
+    def __init__(
+        self,
+        api_key: str,
+        pool_size: int = 32,
+        keepalive_timeout: float = 75.0,
+        cache_ttl: float = 5,
+        retries: int = 3,
+        retry_backoff_base: float = 0.1,
+    ) -> None:
         """__init__
 
         Args:
             api_key (str): Lava JWT-Token
+            pool_size (int, optional): Максимальное число одновременных соединений с API. Defaults to 32.
+            keepalive_timeout (float, optional): Время жизни простаивающего keep-alive соединения в секундах. Defaults to 75.0.
+            cache_ttl (float, optional): Время кэширования ответов на запросы чтения в секундах. 0 - не кэшировать. Defaults to 5.
+            retries (int, optional): Число повторов запроса при сетевых ошибках и ответах 5xx. Defaults to 3.
+            retry_backoff_base (float, optional): Базовая задержка между повторами в секундах, удваивается с каждой попыткой. Defaults to 0.1.
         """
+        if retries < 0:
+            raise ValueError("retries must be >= 0")
         self.api_key = api_key
+        self._pool_size = pool_size
+        self._keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._cache = ResponseCache(ttl=cache_ttl) if cache_ttl else None
+        self._retries = retries
+        self._retry_backoff_base = retry_backoff_base
 
-    async def test_ping(self) -> Dict:
-        """Проверка JWT-токена на авторизацию
-
-        Returns:
-            Dict: {
-                    "status": true
-                }
-        """
-        method = "GET"
-        path = "/test/ping"
-        return await self._request(method, path)
-
-    async def wallet_list(self) -> List:
-        """Список кошельков с их балансами
+    async def __aenter__(self) -> "Lava":
+        return self
 
-        Returns:
-            List: [
-                        {
-                            "account": "U10000002",
-                            "currency": "USD",
-                            "balance": "10.26"
-                        },
-                        {
-                            "account": "E10000003",
-                            "currency": "EUR",
-                            "balance": "1.09"
-                        },
-                        {
-                            "account": "R10000001",
-                            "currency": "RUB",
-                            "balance": "1500.00"
-                        }
-                    ]
-        """
-        method = "GET"
-        path = "/wallet/list"
-        return await self._request(method, path)
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
 
-    @validate_arguments
-    async def withdraw_create(
-        self,
-        account: str,
-        amount: float,
-        service: str,
-        wallet_to: str,
-        order_id: Optional[str] = None,
-        hook_url: Optional[HttpUrl] = None,
-        substract: Optional[int] = None,
-        comment: Optional[str] = None,
-    ) -> Dict:
-        """Создание заявки на вывод
+    async def close(self) -> None:
+        """Закрытие HTTP-сессии клиента"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
-        Args:
-            account (str): Номер кошелька, с которого совершается вывод
-            amount (float): Сумма вывода
-            service (str): Сервис вывода Пример: card
-            wallet_to (str): Номер счета получателя
-            order_id (Optional[str], optional): Номер счета в вашей системе. Должен быть уникальным
-            hook_url (Optional[HttpUrl], optional): Url для отправки webhook (Max: 500). Defaults to None.
-            substract (Optional[int], optional): Откуда списывать комиссию. 1 - с баланса, 0 - с суммы. Если параметр не передан, то комиссия берется с суммы. Defaults to None.
-            comment (Optional[str], optional): Комментарий к выводу. Defaults to None.
-
-        Returns:
-            Dict: {
-                    "id": "3e22b0c8-2c4a-93d8-2f6d-b93ce824ee62", // Номер заявки
-                    "status": "success", // Статус создания заявки
-                    "amount": "1000.01", // Сумма заявки
-                    "commission": 50 // Комиссия
-                }
-
-        """
-        method = "POST"
-        path = "/withdraw/create"
-        data = {
-            "account": account,
-            "amount": amount,
-            "service": service,
-            "wallet_to": wallet_to,
-            "order_id": order_id,
-            "hook_url": hook_url,
-            "substract": substract,
-            "comment": comment,
-        }
-        return await self._request(method, path, data)
-
-    @validate_arguments
     async def withdraw_info(self, id: str) -> Dict:
         """Получение информации о выводе
 
@@ -129,49 +164,11 @@ class Lava:
                 "currency": "RUB" // Валюта
             }
         """
-        method = "POST"
-        path = "/withdraw/info"
+        if not isinstance(id, str):
+            raise TypeError("id must be str")
         data = {"id": id}
-        return await self._request(method, path, data)
-
-    @validate_arguments
-    async def transfer_create(
-        self,
-        account_from: str,
-        account_to: str,
-        amount: float,
-        subtract: Optional[int] = None,
-        comment: str = None,
-    ) -> Dict:
-        """Создание заявки на перевод средств
+        return await self._request("POST", "/withdraw/info", data, cacheable=True)
 
-        Args:
-            account_from (str): Номер кошелька, с которого совершается перевод
-            account_to (str): Номер кошелька, куда совершается перевод
-            amount (float): Сумма вывода
-            subtract (Optional[int], optional): Откуда списывать комиссию. 1 - с баланса, 0 - с суммы. Если параметр не передан, то комиссия берется с суммы. Defaults to None.
-            comment (str, optional): Комментарий к выводу. Defaults to None.
-
-        Returns:
-            Dict: {
-                "id": "3e22b0c8-2c4a-93d8-2f6d-b93ce824ee62", // Номер заявки
-                "status": "success", // Статус создания заявки
-                "amount": "1000.01", // Сумма заявки
-                "commission": 50 // Комиссия
-            }
-        """
-        method = "POST"
-        path = "/transfer/create"
-        data = {
-            "account_from": account_from,
-            "account_to": account_to,
-            "amount": amount,
-            "subtract": subtract,
-            "comment": comment,
-        }
-        return await self._request(method, path, data)
-
-    @validate_arguments
     async def transfer_info(self, id: str) -> Dict:
         """Получение информации о переводе
 
@@ -191,13 +188,12 @@ class Lava:
                 "commission": "0.01" // Комиссия
             }
         """
-        method = "POST"
-        path = "/transfer/info"
+        if not isinstance(id, str):
+            raise TypeError("id must be str")
         data = {"id": id}
-        return await self._request(method, path, data)
+        return await self._request("POST", "/transfer/info", data, cacheable=True)
 
-    @validate_arguments
-    async def transactions_list(
+    async def transactions_list_stream(
         self,
         transfer_type: Optional[str] = None,
         account: Optional[str] = None,
@@ -205,8 +201,11 @@ class Lava:
         period_end: Optional[str] = None,
         offset: Optional[int] = None,
         limit: Optional[int] = None,
-    ) -> List:
-        """Получение списка всех транзакций
+        page_size: int = 50,
+    ) -> AsyncIterator[Dict]:
+        """Постраничный обход всех транзакций
+            Страницы запрашиваются по очереди, пока API не вернет неполную страницу.
+            Если установлен ijson, каждая страница разбирается по мере получения.
 
         Args:
             transfer_type (Optional[str], optional): Тип перевода. withdraw - вывод, transfer - перевод. Defaults to None.
@@ -214,206 +213,299 @@ class Lava:
             period_start (Optional[str], optional): С какого времени показывать транзакции. Defaults to None.
             period_end (Optional[str], optional): До какого времени показывать транзакции. Defaults to None.
             offset (Optional[int], optional): Сдвиг. Defaults to None.
-            limit (Optional[int], optional): Лимит (max 50). Defaults to None.
-
-        Returns:
-            List: [
-                    {
-                        "id": "bc81edeb-3f81-156d-21bd-06c67010094f", // Номер транзакции
-                        "created_at": "1634902579",  // Время создания (unix timestamp)
-                        "created_date": "2021-10-22T11:36:19+00:00", // Время создания
-                        "amount": "1230.00", // Сумма транзакции
-                        "status": "success", // Статус транзакции
-                        "transfer_type": "transfer", // Тип перевода
-                        "comment": "Hello", // Комментарий
-                        "method": "-1", // Метод 1 - зачисление, -1 - расход
-                        "currency": "RUB", // Валюта
-                        "account": "R10000001", // Номер аккаунта
-                        "commission": "12.30", // Комиссия
-                        "type": "out", // Тип in - пополнение, out - перевод
-                        "receiver": "R10000000" // Номер аккаунта получателя
-                    }
-                ]
-        """
-        method = "POST"
-        path = "/transactions/list"
-        data = {
-            "transfer_type": transfer_type,
-            "account": account,
-            "period_start": period_start,
-            "period_end": period_end,
-            "offset": offset,
-            "limit": limit,
-        }
-        return await self._request(method, path, data)
-
-    @validate_arguments
-    async def invoice_create(
-        self,
-        wallet_to: str,
-        sum: float,
-        order_id: Optional[str] = None,
-        hook_url: Optional[HttpUrl] = None,
-        success_url: Optional[HttpUrl] = None,
-        fail_url: Optional[HttpUrl] = None,
-        exprire: Optional[int] = None,
-        substract: Optional[int] = None,
-        custom_fields: Optional[str] = None,
-        comment: Optional[str] = None,
-        merchant_id: Optional[str] = None,
-        merchant_name: Optional[str] = None,
-    ) -> Dict:
-        """Выставление счета на оплату
-
-        Args:
-            wallet_to (str): Ваш номер счета, на который будут зачислены средства
-            sum (float): Сумма, с указанием двух знаков после точки
-            order_id (Optional[str], optional): Номер счета в вашей системе. Должен быть уникальным. Defaults to None.
-            hook_url (Optional[HttpUrl], optional): Url для отправки webhook. (Max: 500). Defaults to None.
-            success_url (Optional[HttpUrl], optional): Url для переадресации после успешной оплаты. (Max: 500). Defaults to None.
-            fail_url (Optional[HttpUrl], optional): Url для переадресации после неудачной оплаты. (Max: 500). Defaults to None.
-            exprire (Optional[int], optional): Время жизни счета в минутах. По умолчанию: 1440. Минимум: 1. Максимум: 43200. Defaults to None.
-            substract (Optional[int], optional): С кого списывать комиссию. 1 - Списывать с клиента. 0 - Списывать с магазина. По умолчанию: 0. Defaults to None.
-            custom_fields (Optional[str], optional): Дополнительное поле, которое возвращается в WebHook. Defaults to None.
-            comment (Optional[str], optional): Комментарий к оплате. Defaults to None.
-            merchant_id (Optional[str], optional): ID мерчанта (используется только в WebHook). Defaults to None.
-            merchant_name (Optional[str], optional): Название мерчанта (отображается в форме перевода). Defaults to None.
+            limit (Optional[int], optional): Максимальное общее число транзакций. None - все. Defaults to None.
+            page_size (int, optional): Размер страницы (от 1, значения больше 50 уменьшаются до 50). Defaults to 50.
 
-        Returns:
-            Dict: {
-                // Статус запроса
-                "status": "success",
-                // Номер счета на оплату
-                "id": "1ee31634-e3e0-34ce-1423-b5b4cb524c6a",
-                // Ссылка на оплату
-                "url": "https://p2p.lava.ru/form?id=1ee31634-e3e0-34ce-1423-b5b4cb524c6a",
-                // Время истечения счета
-                "expire": 1636983503,
-                // Сумма счета
-                "sum": "100.00",
-                // URL для переадресации после успешной оплаты
-                "success_url": "https://lava.ru?success",
-                // URL для переадресации после неудачной оплаты
-                "fail_url": "https://lava.ru?fail",
-                // URL для отправки webhook
-                "hook_url": "https://lava.ru?hook",
-                // Дополнительное поле
-                "custom_fields": "123",
-                // ID и наименование мерчанта
-                "merchant_name": "123",
-                "merchant_id": "123",
-            }
+        Yields:
+            Dict: Транзакция в формате transactions_list
         """
-        method = "POST"
-        path = "/invoice/create"
-        data = {
-            "wallet_to": wallet_to,
-            "sum": sum,
-            "order_id": order_id,
-            "hook_url": hook_url,
-            "success_url": success_url,
-            "fail_url": fail_url,
-            "exprire": exprire,
-            "substract": substract,
-            "custom_fields": custom_fields,
-            "comment": comment,
-            "merchant_id": merchant_id,
-            "merchant_name": merchant_name,
-        }
-        return await self._request(method, path, data)
-
-    @validate_arguments
-    async def invoice_info(
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if limit is not None and limit < 0:
+            raise ValueError("limit must not be negative")
+        # The API never returns more than 50 items per page
+        page_size = min(page_size, 50)
+        params = models.TransactionsList(
+            transfer_type=transfer_type,
+            account=account,
+            period_start=period_start,
+            period_end=period_end,
+            offset=0 if offset is None else offset,
+            limit=page_size,
+        )
+        remaining = limit
+        while remaining is None or remaining > 0:
+            if remaining is not None:
+                params.limit = min(page_size, remaining)
+                remaining -= params.limit
+            data = params.model_dump(mode="json", exclude_none=True)
+            count = 0
+            async for transaction in self._request_items(
+                "POST", "/transactions/list", data
+            ):
+                count += 1
+                yield transaction
+            if count < params.limit:
+                return
+            params.offset += count
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                base_url=self.path_prefix,
+                headers={"Authorization": self.api_key},
+                json_serialize=_json_dumps,
+                connector=aiohttp.TCPConnector(
+                    limit=self._pool_size,
+                    limit_per_host=self._pool_size,
+                    keepalive_timeout=self._keepalive_timeout,
+                    enable_cleanup_closed=True,
+                    resolver=aiohttp.AsyncResolver() if aiodns is not None else None,
+                    use_dns_cache=True,
+                    ttl_dns_cache=300,
+                    # api.lava.ru has no AAAA record, don't wait for IPv6 attempts
+                    family=socket.AF_INET,
+                ),
+            )
+        return self._session
+
+    async def _send(
+        self, method, path, data: Optional[Dict], idempotent: bool
+    ) -> aiohttp.ClientResponse:
+        session = await self._ensure_session()
+        for attempt in range(self._retries + 1):
+            last = attempt == self._retries
+            try:
+                responce = await session.request(method, path, json=data)
+            except aiohttp.ClientConnectorError:
+                if last:
+                    raise
+            except asyncio.TimeoutError:
+                if last or not idempotent:
+                    raise
+            else:
+                if responce.status < 500 or last or not idempotent:
+                    return responce
+                responce.release()
+            delay = min(30, self._retry_backoff_base * 2**attempt)
+            await asyncio.sleep(delay * random.uniform(0.5, 1.5))
+
+    async def _request(
         self,
-        id: Optional[str] = None,
-        order_id: Optional[str] = None,
+        method,
+        path,
+        data: Optional[Dict] = None,
+        cacheable: bool = False,
+        invalidate: bool = False,
     ) -> Dict:
-        """Получение информации о выставленном счете
-
-        Args:
-            id (Optional[str], optional): Номер счета в нашей системе. Обязателен если не передан 'order_id'. Defaults to None.
-            order_id (Optional[str], optional): Номер счета в системе клиента. Обязателен если не передан 'id'. Defaults to None.
-
-        Returns:
-            Dict: {
-                // Статус запроса
-                "status": "success",
-                "invoice": {
-                    // Номер счета на оплату
-                    "id": "1ee31634-e3e0-34ce-1423-b5b4cb524c6a",
-                    // Номер счета в системе клиента
-                    "order_id": "order_125",
-                    // Время истечение счета
-                    "expire": 1636983503,
-                    // Сумма счета
-                    "sum": "100.00",
-                    // Комментарий
-                    "comment": "На бигтести с колой",
-                    // Статус счета
-                    "status": "success",
-                    // URL для переадресации после успешной оплаты
-                    "success_url": "https://lava.ru?success",
-                    // URL для переадресации после неудачной оплаты
-                    "fail_url": "https://lava.ru?fail",
-                    // URL для отправки webhook
-                    "hook_url": "https://lava.ru?hook",
-                    // Дополнительное поле
-                    "custom_fields": "123"
-                }
-            }
-        """
-        method = "POST"
-        path = "/invoice/info"
-        data = {"id": id, "order_id": order_id}
-        return await self._request(method, path, data)
-
-    @validate_arguments
-    async def invoice_set_webhook(self, url: HttpUrl) -> Dict:
-        """Установка URL для отправки HTTP-уведомлений
-
-        Args:
-            url (HttpUrl): URL, на который будут приходить HTTP-уведомления
-
-        Returns:
-            Dict: {
-                "status": "success"
-            }
-        """
-        method = "POST"
-        path = "/invoice/set-webhook"
-        data = {"url": url}
-        return await self._request(method, path, data)
-
-    async def invoice_generate_secret_key(self) -> Dict:
-        """Генерация секретных ключей
-            Ключ secret_key требуется для генерации сигнатуры в устаревшем способе выставление счета.
-            Ключ secret_key_2 используется для генерации сигнатуры в WebHook.
-
-        Returns:
-            Dict: {
-                "status": "success",
-                "secret_key": "2wUgAjoyUhnvhVdn0AWSjLZyNYDUbYtA",
-                "secret_key_2": "2wUgAjoyUhnvhVdn0AWSjLZyNYDUbYtA"
-            }
-        """
-        method = "GET"
-        path = "/invoice/generate-secret-key"
-        return await self._request(method, path)
-
-    async def _request(self, method, path, data={}) -> Dict:
-        url = self.path_prefix + path
-        headers = {
-            "Authorization": self.api_key,
-        }
-        for key in list(data):
-            if data[key] is None:
-                data.pop(key)
-        async with aiohttp.ClientSession() as session:
-            async with session.request(
-                method, url, headers=headers, data=data
+        if cacheable and self._cache is not None:
+            result = self._cache.get(path, data)
+            if result is not None:
+                return result
+        try:
+            # Creating requests may already have been applied when a timeout or
+            # 5xx comes back, so only retry them if the connection was never made
+            async with await self._send(
+                method, path, data, idempotent=not invalidate
             ) as responce:
-                result = await responce.json()
-                if isinstance(result, dict) and result.get("status") == "error":
-                    raise LavaError(f'{result["code"]}: {result["message"]}')
-                else:
-                    return result
+                result = await _read_json(responce)
+            _raise_for_error(result)
+        finally:
+            if invalidate and self._cache is not None:
+                # Balances and statuses may have changed, even if the request failed
+                self._cache.clear()
+        if cacheable and self._cache is not None:
+            self._cache.set(path, data, result)
+        return result
+
+    async def _request_items(
+        self, method, path, data: Optional[Dict] = None
+    ) -> AsyncIterator[Any]:
+        async with await self._send(method, path, data, idempotent=True) as responce:
+            if responce.status >= 400:
+                # Raises LavaError or aiohttp.ClientResponseError
+                _raise_for_error(await _read_json(responce))
+
+            if ijson is None:
+                head = (await responce.read()).lstrip()
+            else:
+                head = b""
+                while not head:
+                    chunk = await responce.content.readany()
+                    if not chunk:
+                        break
+                    head = chunk.lstrip()
+            if not head.startswith(b"["):
+                body = head + await responce.content.read()
+                try:
+                    result = _json_loads(body) if body else None
+                except ValueError:
+                    result = body
+                _raise_for_error(result)
+                raise LavaResponseError(path, result)
+
+            if ijson is None:
+                for item in _json_loads(head):
+                    yield item
+                return
+
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, "item", use_float=True)
+            chunk = head
+            while chunk:
+                parser.send(chunk)
+                for item in items:
+                    yield item
+                del items[:]
+                chunk = await responce.content.readany()
+            parser.close()
+            for item in items:
+                yield item
+
+
+_CLIENTS: Dict[str, Lava] = {}
+
+
+async def get_client(api_key: str, **kwargs) -> Lava:
+    """Общий на процесс клиент для токена
+        Повторные вызовы с тем же токеном возвращают тот же клиент с той же HTTP-сессией.
+        Закройте клиенты через close_all() при завершении приложения.
+
+    Args:
+        api_key (str): Lava JWT-Token
+        **kwargs: Параметры Lava, используются только при первом создании клиента
+
+    Returns:
+        Lava: Клиент
+    """
+    client = _CLIENTS.get(api_key)
+    if client is None:
+        client = _CLIENTS[api_key] = Lava(api_key, **kwargs)
+    await client._ensure_session()
+    return client
+
+
+async def close_all() -> None:
+    """Закрытие всех клиентов, созданных через get_client()"""
+    clients = list(_CLIENTS.values())
+    _CLIENTS.clear()
+    await asyncio.gather(*(client.close() for client in clients))
+
+
+class _Endpoint(NamedTuple):
+    name: str
+    method: str
+    path: str
+    model: Type[BaseModel]
+    response: Optional[Type[BaseModel]] = None
+    cacheable: bool = False
+    invalidate: bool = False
+
+
+_ENDPOINTS = [
+    _Endpoint("test_ping", "GET", "/test/ping", models.TestPing, cacheable=True),
+    _Endpoint("wallet_list", "GET", "/wallet/list", models.WalletList, cacheable=True),
+    _Endpoint(
+        "withdraw_create",
+        "POST",
+        "/withdraw/create",
+        models.WithdrawCreate,
+        models.WithdrawCreateResponse,
+        invalidate=True,
+    ),
+    _Endpoint(
+        "transfer_create",
+        "POST",
+        "/transfer/create",
+        models.TransferCreate,
+        models.TransferCreateResponse,
+        invalidate=True,
+    ),
+    _Endpoint(
+        "transactions_list", "POST", "/transactions/list", models.TransactionsList
+    ),
+    _Endpoint(
+        "invoice_create",
+        "POST",
+        "/invoice/create",
+        models.InvoiceCreate,
+        models.InvoiceCreateResponse,
+        invalidate=True,
+    ),
+    _Endpoint(
+        "invoice_info", "POST", "/invoice/info", models.InvoiceInfo, cacheable=True
+    ),
+    _Endpoint(
+        "invoice_set_webhook", "POST", "/invoice/set-webhook", models.InvoiceSetWebhook
+    ),
+    _Endpoint(
+        "invoice_generate_secret_key",
+        "GET",
+        "/invoice/generate-secret-key",
+        models.InvoiceGenerateSecretKey,
+    ),
+]
+
+
+def _make_method(endpoint: _Endpoint):
+    model = endpoint.model
+    response = endpoint.response
+    fields = tuple(model.model_fields)
+
+    async def method(self, *args, **kwargs):
+        if len(args) > len(fields):
+            raise TypeError(
+                f"{endpoint.name}() takes {len(fields)} positional arguments"
+                f" but {len(args)} were given"
+            )
+        for name, value in zip(fields, args):
+            if name in kwargs:
+                raise TypeError(
+                    f"{endpoint.name}() got multiple values for argument '{name}'"
+                )
+            kwargs[name] = value
+        params = model.model_validate(kwargs)
+        data = (
+            params.model_dump(mode="json", exclude_none=True, by_alias=True)
+            if fields
+            else None
+        )
+        result = await self._request(
+            endpoint.method,
+            endpoint.path,
+            data,
+            cacheable=endpoint.cacheable,
+            invalidate=endpoint.invalidate,
+        )
+        if response is None:
+            return result
+        try:
+            return response.model_validate(result)
+        except ValidationError as e:
+            # The request has already been applied, so this must not look like
+            # a LavaError that callers may retry on
+            raise LavaResponseError(endpoint.path, result) from e
+
+    parameters = [inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+    for name, field in model.model_fields.items():
+        parameters.append(
+            inspect.Parameter(
+                name,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                default=(
+                    inspect.Parameter.empty if field.is_required() else field.default
+                ),
+                annotation=field.annotation,
+            )
+        )
+    method.__name__ = endpoint.name
+    method.__qualname__ = f"Lava.{endpoint.name}"
+    method.__doc__ = model.__doc__
+    method.__signature__ = inspect.Signature(
+        parameters, return_annotation=response if response is not None else Any
+    )
+    return method
+
+
+for _endpoint in _ENDPOINTS:
+    setattr(Lava, _endpoint.name, _make_method(_endpoint))
@@ -0,0 +1,303 @@
+from decimal import Decimal
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, HttpUrl
+
+
+class _RequestModel(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+
+class TestPing(_RequestModel):
+    """Проверка JWT-токена на авторизацию
+
+    Returns:
+        Dict: {
+                "status": true
+            }
+    """
+
+
+class WalletList(_RequestModel):
+    """Список кошельков с их балансами
+
+    Returns:
+        List: [
+                    {
+                        "account": "U10000002",
+                        "currency": "USD",
+                        "balance": "10.26"
+                    },
+                    {
+                        "account": "E10000003",
+                        "currency": "EUR",
+                        "balance": "1.09"
+                    },
+                    {
+                        "account": "R10000001",
+                        "currency": "RUB",
+                        "balance": "1500.00"
+                    }
+                ]
+    """
+
+
+class WithdrawCreate(_RequestModel):
+    """Создание заявки на вывод
+
+    Args:
+        account (str): Номер кошелька, с которого совершается вывод
+        amount (float): Сумма вывода
+        service (str): Сервис вывода Пример: card
+        wallet_to (str): Номер счета получателя
+        order_id (Optional[str], optional): Номер счета в вашей системе. Должен быть уникальным
+        hook_url (Optional[HttpUrl], optional): Url для отправки webhook (Max: 500). Defaults to None.
+        substract (Optional[int], optional): Откуда списывать комиссию. 1 - с баланса, 0 - с суммы. Если параметр не передан, то комиссия берется с суммы. Defaults to None.
+        comment (Optional[str], optional): Комментарий к выводу. Defaults to None.
+
+    Returns:
+        WithdrawCreateResponse: {
+                "id": "3e22b0c8-2c4a-93d8-2f6d-b93ce824ee62", // Номер заявки
+                "status": "success", // Статус создания заявки
+                "amount": "1000.01", // Сумма заявки
+                "commission": 50 // Комиссия
+            }
+
+    """
+
+    account: str
+    amount: float
+    service: str
+    wallet_to: str
+    order_id: Optional[str] = None
+    hook_url: Optional[HttpUrl] = None
+    substract: Optional[int] = None
+    comment: Optional[str] = None
+
+
+class TransferCreate(_RequestModel):
+    """Создание заявки на перевод средств
+
+    Args:
+        account_from (str): Номер кошелька, с которого совершается перевод
+        account_to (str): Номер кошелька, куда совершается перевод
+        amount (float): Сумма вывода
+        subtract (Optional[int], optional): Откуда списывать комиссию. 1 - с баланса, 0 - с суммы. Если параметр не передан, то комиссия берется с суммы. Defaults to None.
+        comment (str, optional): Комментарий к выводу. Defaults to None.
+
+    Returns:
+        TransferCreateResponse: {
+            "id": "3e22b0c8-2c4a-93d8-2f6d-b93ce824ee62", // Номер заявки
+            "status": "success", // Статус создания заявки
+            "amount": "1000.01", // Сумма заявки
+            "commission": 50 // Комиссия
+        }
+    """
+
+    account_from: str
+    account_to: str
+    amount: float
+    subtract: Optional[int] = None
+    comment: Optional[str] = None
+
+
+class TransactionsList(_RequestModel):
+    """Получение списка всех транзакций
+
+    Args:
+        transfer_type (Optional[str], optional): Тип перевода. withdraw - вывод, transfer - перевод. Defaults to None.
+        account (Optional[str], optional): Номер кошелька. Defaults to None.
+        period_start (Optional[str], optional): С какого времени показывать транзакции. Defaults to None.
+        period_end (Optional[str], optional): До какого времени показывать транзакции. Defaults to None.
+        offset (Optional[int], optional): Сдвиг. Defaults to None.
+        limit (Optional[int], optional): Лимит (max 50). Defaults to None.
+
+    Returns:
+        List: [
+                {
+                    "id": "bc81edeb-3f81-156d-21bd-06c67010094f", // Номер транзакции
+                    "created_at": "1634902579",  // Время создания (unix timestamp)
+                    "created_date": "2021-10-22T11:36:19+00:00", // Время создания
+                    "amount": "1230.00", // Сумма транзакции
+                    "status": "success", // Статус транзакции
+                    "transfer_type": "transfer", // Тип перевода
+                    "comment": "Hello", // Комментарий
+                    "method": "-1", // Метод 1 - зачисление, -1 - расход
+                    "currency": "RUB", // Валюта
+                    "account": "R10000001", // Номер аккаунта
+                    "commission": "12.30", // Комиссия
+                    "type": "out", // Тип in - пополнение, out - перевод
+                    "receiver": "R10000000" // Номер аккаунта получателя
+                }
+            ]
+    """
+
+    transfer_type: Optional[str] = None
+    account: Optional[str] = None
+    period_start: Optional[str] = None
+    period_end: Optional[str] = None
+    offset: Optional[int] = None
+    limit: Optional[int] = None
+
+
+class InvoiceCreate(_RequestModel):
+    """Выставление счета на оплату
+
+    Args:
+        wallet_to (str): Ваш номер счета, на который будут зачислены средства
+        sum (float): Сумма, с указанием двух знаков после точки
+        order_id (Optional[str], optional): Номер счета в вашей системе. Должен быть уникальным. Defaults to None.
+        hook_url (Optional[HttpUrl], optional): Url для отправки webhook. (Max: 500). Defaults to None.
+        success_url (Optional[HttpUrl], optional): Url для переадресации после успешной оплаты. (Max: 500). Defaults to None.
+        fail_url (Optional[HttpUrl], optional): Url для переадресации после неудачной оплаты. (Max: 500). Defaults to None.
+        exprire (Optional[int], optional): Время жизни счета в минутах. По умолчанию: 1440. Минимум: 1. Максимум: 43200. Defaults to None.
+        substract (Optional[int], optional): С кого списывать комиссию. 1 - Списывать с клиента. 0 - Списывать с магазина. По умолчанию: 0. Defaults to None.
+        custom_fields (Optional[str], optional): Дополнительное поле, которое возвращается в WebHook. Defaults to None.
+        comment (Optional[str], optional): Комментарий к оплате. Defaults to None.
+        merchant_id (Optional[str], optional): ID мерчанта (используется только в WebHook). Defaults to None.
+        merchant_name (Optional[str], optional): Название мерчанта (отображается в форме перевода). Defaults to None.
+
+    Returns:
+        InvoiceCreateResponse: {
+            // Статус запроса
+            "status": "success",
+            // Номер счета на оплату
+            "id": "1ee31634-e3e0-34ce-1423-b5b4cb524c6a",
+            // Ссылка на оплату
+            "url": "https://p2p.lava.ru/form?id=1ee31634-e3e0-34ce-1423-b5b4cb524c6a",
+            // Время истечения счета
+            "expire": 1636983503,
+            // Сумма счета
+            "sum": "100.00",
+            // URL для переадресации после успешной оплаты
+            "success_url": "https://lava.ru?success",
+            // URL для переадресации после неудачной оплаты
+            "fail_url": "https://lava.ru?fail",
+            // URL для отправки webhook
+            "hook_url": "https://lava.ru?hook",
+            // Дополнительное поле
+            "custom_fields": "123",
+            // ID и наименование мерчанта
+            "merchant_name": "123",
+            "merchant_id": "123",
+        }
+    """
+
+    wallet_to: str
+    sum: float
+    order_id: Optional[str] = None
+    hook_url: Optional[HttpUrl] = None
+    success_url: Optional[HttpUrl] = None
+    fail_url: Optional[HttpUrl] = None
+    exprire: Optional[int] = None
+    substract: Optional[int] = None
+    custom_fields: Optional[str] = None
+    comment: Optional[str] = None
+    merchant_id: Optional[str] = None
+    merchant_name: Optional[str] = None
+
+
+class InvoiceInfo(_RequestModel):
+    """Получение информации о выставленном счете
+
+    Args:
+        id (Optional[str], optional): Номер счета в нашей системе. Обязателен если не передан 'order_id'. Defaults to None.
+        order_id (Optional[str], optional): Номер счета в системе клиента. Обязателен если не передан 'id'. Defaults to None.
+
+    Returns:
+        Dict: {
+            // Статус запроса
+            "status": "success",
+            "invoice": {
+                // Номер счета на оплату
+                "id": "1ee31634-e3e0-34ce-1423-b5b4cb524c6a",
+                // Номер счета в системе клиента
+                "order_id": "order_125",
+                // Время истечение счета
+                "expire": 1636983503,
+                // Сумма счета
+                "sum": "100.00",
+                // Комментарий
+                "comment": "На бигтести с колой",
+                // Статус счета
+                "status": "success",
+                // URL для переадресации после успешной оплаты
+                "success_url": "https://lava.ru?success",
+                // URL для переадресации после неудачной оплаты
+                "fail_url": "https://lava.ru?fail",
+                // URL для отправки webhook
+                "hook_url": "https://lava.ru?hook",
+                // Дополнительное поле
+                "custom_fields": "123"
+            }
+        }
+    """
+
+    id: Optional[str] = None
+    order_id: Optional[str] = None
+
+
+class InvoiceSetWebhook(_RequestModel):
+    """Установка URL для отправки HTTP-уведомлений
+
+    Args:
+        url (HttpUrl): URL, на который будут приходить HTTP-уведомления
+
+    Returns:
+        Dict: {
+            "status": "success"
+        }
+    """
+
+    url: HttpUrl
+
+
+class InvoiceGenerateSecretKey(_RequestModel):
+    """Генерация секретных ключей
+        Ключ secret_key требуется для генерации сигнатуры в устаревшем способе выставление счета.
+        Ключ secret_key_2 используется для генерации сигнатуры в WebHook.
+
+    Returns:
+        Dict: {
+            "status": "success",
+            "secret_key": "2wUgAjoyUhnvhVdn0AWSjLZyNYDUbYtA",
+            "secret_key_2": "2wUgAjoyUhnvhVdn0AWSjLZyNYDUbYtA"
+        }
+    """
+
+
+class _ResponseModel(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+
+class WithdrawCreateResponse(_ResponseModel):
+    """Ответ на создание заявки на вывод"""
+
+    id: str
+    status: str
+    amount: Optional[Decimal] = None
+    commission: Optional[Decimal] = None
+
+
+class TransferCreateResponse(_ResponseModel):
+    """Ответ на создание заявки на перевод средств"""
+
+    id: str
+    status: str
+    amount: Optional[Decimal] = None
+    commission: Optional[Decimal] = None
+
+
+class InvoiceCreateResponse(_ResponseModel):
+    """Ответ на выставление счета на оплату"""
+
+    status: str
+    id: str
+    url: Optional[str] = None
+    expire: Optional[int] = None
+    sum: Optional[Decimal] = None
+    success_url: Optional[str] = None
+    fail_url: Optional[str] = None
+    hook_url: Optional[str] = None
+    custom_fields: Optional[str] = None
+    merchant_name: Optional[str] = None
+    merchant_id: Optional[str] = None
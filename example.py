@@ -4,22 +4,22 @@ import asyncio
 token = 'your_token_here'
 
 async def main(token):
-    client = Lava(token)
+    async with Lava(token) as client:
+        try:
+            ping_result, all_wallets = await asyncio.gather(
+                client.test_ping(),
+                client.wallet_list(),
+            )
+            print(ping_result)
+            print(all_wallets)
 
-    try:
-        ping_result = await client.test_ping()
-        print(ping_result)
-
-        all_wallets = await client.wallet_list()
-        print(all_wallets)
-
-        all_transfers = await client.transactions_list(
-            transfer_type='transfer',
-            account=all_wallets[0].get('account'),
-        )
-        print(all_transfers)
-    except LavaError as e:
-        print(e)
+            all_transfers = await client.transactions_list(
+                transfer_type='transfer',
+                account=all_wallets[0].get('account'),
+            )
+            print(all_transfers)
+        except LavaError as e:
+            print(e)
 
 
 if __name__ == '__main__':